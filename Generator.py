@@ -1,6 +1,20 @@
+import warnings
 import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional, fall back to in-place NumPy
+    numexpr = None
+
 # -------------------------------
 # Generator Class
 # -------------------------------
@@ -20,7 +34,12 @@ class Generator:
         self.droop = droop
         self.response_rate = response_rate
         self.current_output = 0.0
-        self.p_output = []
+        self._out = np.empty(0)  # output history buffer, first _i entries are valid
+        self._i = 0
+
+    @property
+    def p_output(self):
+        return self._out[:self._i]
 
     def dispatch(self, freq_dev, demand_share):
         """
@@ -31,66 +50,268 @@ class Generator:
 
         # Smooth inertia-based adjustment
         self.current_output += self.response_rate * (setpoint - self.current_output)
-        self.p_output.append(self.current_output)
+
+        if self._i == len(self._out):
+            self._out = np.concatenate([self._out, np.empty(max(self._i, 16))])
+        self._out[self._i] = self.current_output
+        self._i += 1
         return self.current_output
 
+# -------------------------------
+# Generator Set Class
+# -------------------------------
+class GeneratorSet:
+    def __init__(self, names, p_max, inertia, damping, droop=0.05, response_rate=0.2):
+        """
+        Fleet of generators stored as parallel arrays (one entry per generator).
+        Parameters are as for Generator; scalars apply to every generator.
+        """
+        self.names = list(names)
+        n_gen = len(self.names)
+        self.p_max = np.broadcast_to(np.asarray(p_max, dtype=np.float64), (n_gen,)).copy()
+        self.inertia = np.broadcast_to(np.asarray(inertia, dtype=np.float64), (n_gen,)).copy()
+        self.damping = np.broadcast_to(np.asarray(damping, dtype=np.float64), (n_gen,)).copy()
+        self.droop = np.broadcast_to(np.asarray(droop, dtype=np.float64), (n_gen,)).copy()
+        self.response_rate = np.broadcast_to(np.asarray(response_rate, dtype=np.float64), (n_gen,)).copy()
+        self.current_output = np.zeros(n_gen)
+        self._out = np.empty((n_gen, 0))  # one contiguous output history row per generator
+        self._i = 0
+
+    @classmethod
+    def from_generators(cls, generators):
+        fleet = cls(
+            [g.name for g in generators],
+            [g.p_max for g in generators],
+            [g.inertia for g in generators],
+            [g.damping for g in generators],
+            [g.droop for g in generators],
+            [g.response_rate for g in generators],
+        )
+        fleet.current_output[:] = [g.current_output for g in generators]
+        return fleet
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def share_frac(self):
+        # Base share of load per generator, follows any change to p_max
+        return self.p_max / self.p_max.sum()
+
+    @property
+    def p_output(self):
+        return self._out[:, :self._i]
+
+    def dispatch(self, freq_dev, demand):
+        """
+        Droop + inertia dispatch of the whole fleet, returns total output (MW)
+        """
+        setpoint = np.clip(demand * self.share_frac - freq_dev / self.droop, 0, self.p_max)
+        self.current_output += self.response_rate * (setpoint - self.current_output)
+
+        if self._i == self._out.shape[1]:
+            grow = np.empty((len(self), max(self._i, 16)))
+            self._out = np.concatenate([self._out, grow], axis=1)
+        self._out[:, self._i] = self.current_output
+        self._i += 1
+        return self.current_output.sum()
+
 # -------------------------------
 # Load Profile Class
 # -------------------------------
 class LoadProfile:
-    def __init__(self, base_load, peak_load, hours=24, dt=0.1, noise_std=1.0):
+    def __init__(self, base_load, peak_load, hours=24, dt=0.1, noise_std=1.0, seed=None):
         self.base_load = base_load
         self.peak_load = peak_load
         self.hours = hours
         self.dt = dt
         self.noise_std = noise_std
         self.time = np.arange(0, hours, dt)
+        self._rng = np.random.default_rng(seed)
         self.profile = self._generate_duck_curve()
 
     def _generate_duck_curve(self):
-        base_curve = (self.base_load +
-                      (self.peak_load - self.base_load) *
-                      np.exp(-0.5 * ((self.time - 19) / 3) ** 2) +
-                      0.2 * self.base_load * np.sin(0.5 * self.time))
-        noise = np.random.normal(0, self.noise_std, len(self.time))
-        return base_curve + noise
+        base = self.base_load
+        amp = self.peak_load - self.base_load
+        t2 = (self.time - 19) / 3
+
+        if numexpr is not None:
+            # Single fused pass over the time axis
+            base_curve = numexpr.evaluate(
+                "base + amp * exp(-0.5 * t2 * t2) + 0.2 * base * sin(0.5 * t)",
+                local_dict={"base": base, "amp": amp, "t2": t2, "t": self.time},
+            )
+        else:
+            # Same curve, reusing t2 as the output buffer
+            t2 *= t2
+            t2 *= -0.5
+            np.exp(t2, out=t2)
+            t2 *= amp
+            t2 += base
+            t2 += 0.2 * base * np.sin(0.5 * self.time)
+            base_curve = t2
+
+        base_curve += self._rng.standard_normal(len(self.time)) * self.noise_std
+        return base_curve
+
+# -------------------------------
+# Simulation Kernel
+# -------------------------------
+@njit(cache=True, fastmath=True)
+def _simulate(demand, p_max, share_frac, droop, resp, inertia, current, damping, dt, nominal, freq, outputs):
+    """
+    Droop dispatch + swing equation recurrence over the whole demand profile.
+
+    share_frac : Base share of load per generator (GeneratorSet.share_frac)
+    current    : Generator outputs at the start of the run (updated in place)
+    freq       : Frequency buffer of shape (n_steps + 1,), freq[0] holds the start value
+    outputs    : Output buffer of shape (n_gen, n_steps)
+
+    Fills and returns (freq, outputs)
+    """
+    n_steps = demand.shape[0]
+    n_gen = p_max.shape[0]
+
+    total_inertia = 0.0
+    for i in range(n_gen):
+        total_inertia += inertia[i]
+
+    # Loop invariant swing equation scale
+    denom = 2 * total_inertia * nominal
+
+    for t in range(n_steps):
+        freq_dev = freq[t] - nominal
+
+        gen_power = 0.0
+        for i in range(n_gen):
+            # Droop response setpoint on top of the capacity-weighted base share
+            setpoint = demand[t] * share_frac[i] - freq_dev / droop[i]
+            setpoint = min(max(setpoint, 0.0), p_max[i])
+
+            # Smooth inertia-based adjustment
+            current[i] += resp[i] * (setpoint - current[i])
+            outputs[i, t] = current[i]
+            gen_power += current[i]
+
+        # Swing equation for frequency update
+        df_dt = (gen_power - demand[t] - damping * freq_dev) / denom
+        freq[t + 1] = freq[t] + df_dt * dt
+
+    return freq, outputs
+
+def _state_space(share_frac, droop, resp, damping, dt, denom):
+    """
+    Closed-loop step x[t+1] = M @ x[t] + N * demand[t] for x = [outputs..., freq_dev],
+    exact for the kernel above while no droop setpoint is clipped.
+    Returns (M, N) with shapes (n_gen + 1, n_gen + 1) and (n_gen + 1,)
+    """
+    n_gen = len(share_frac)
+    k = dt / denom
+    gain = resp / droop
+
+    M = np.zeros((n_gen + 1, n_gen + 1))
+    M[:n_gen, :n_gen] = np.diag(1 - resp)
+    M[:n_gen, n_gen] = -gain
+    M[n_gen, :n_gen] = k * (1 - resp)
+    M[n_gen, n_gen] = 1 - k * (gain.sum() + damping)
+
+    N = np.empty(n_gen + 1)
+    N[:n_gen] = resp * share_frac
+    N[n_gen] = k * ((resp * share_frac).sum() - 1)
+    return M, N
 
 # -------------------------------
 # Grid Class
 # -------------------------------
 class Grid:
     def __init__(self, generators, load_profile, nominal_freq=50, dt=0.1, damping=1.0):
+        """
+        generators : GeneratorSet, or a list of Generator objects
+        """
+        if isinstance(generators, GeneratorSet):
+            self._members = []
+        else:
+            self._members = list(generators)
+            generators = GeneratorSet.from_generators(self._members)
         self.generators = generators
         self.load_profile = load_profile
         self.nominal_freq = nominal_freq
         self.dt = dt
         self.damping = damping
-        self.frequency = [nominal_freq]
+
+        # Every run starts from the fleet state the grid was built with
+        self._initial_output = generators.current_output.copy()
+        self._allocate(len(load_profile.profile))
+
+    def _allocate(self, n_steps):
+        """
+        Preallocate frequency and output histories for n_steps of load profile
+        """
+        fleet = self.generators
+        self.frequency = np.empty(n_steps + 1, dtype=np.float64)
+        self.frequency[0] = self.nominal_freq
+        fleet._out = np.empty((len(fleet), n_steps), dtype=np.float64)
+        fleet._i = 0
+
+        # Individual generators keep a view of their row of the fleet history
+        for i, g in enumerate(self._members):
+            g._out = fleet._out[i]
+            g._i = 0
+
+    def state_space(self):
+        """
+        (M, N) of the linearised dispatch + swing equation step, see _state_space
+        """
+        fleet = self.generators
+        denom = 2 * fleet.inertia.sum() * self.nominal_freq
+        return _state_space(fleet.share_frac, fleet.droop, fleet.response_rate,
+                            self.damping, self.dt, denom)
 
     def run_simulation(self):
-        total_capacity = sum(g.p_max for g in self.generators)
+        """
+        Simulate the current load profile from the initial state: frequency
+        restarts at nominal and generator outputs at their values when the
+        grid was built, so repeated runs give the same result
+        """
+        fleet = self.generators
+        demand = np.asarray(self.load_profile.profile, dtype=np.float64)
 
-        for demand in self.load_profile.profile:
-            freq = self.frequency[-1]
-            freq_dev = freq - self.nominal_freq
+        # Buffers follow the profile as it is now; the compiled kernel does no bounds checks
+        n_steps = len(demand)
+        if self.frequency.shape != (n_steps + 1,) or fleet._out.shape != (len(fleet), n_steps):
+            self._allocate(n_steps)
+        else:
+            self.frequency[0] = self.nominal_freq
+        fleet.current_output[:] = self._initial_output
 
-            # Base share of load according to generator capacity
-            base_shares = [demand * (g.p_max / total_capacity) for g in self.generators]
+        # The explicit Euler step blows up once the linearised step is unstable
+        M, _ = self.state_space()
+        if np.abs(np.linalg.eigvals(M)).max() > 1:
+            warnings.warn(f"dt={self.dt} is too large for a stable swing equation step")
 
-            # Dispatch with droop and inertia
-            gen_power = sum(
-                g.dispatch(freq_dev, base_shares[i]) for i, g in enumerate(self.generators)
-            )
+        _simulate(
+            demand,
+            fleet.p_max,
+            fleet.share_frac,
+            fleet.droop,
+            fleet.response_rate,
+            fleet.inertia,
+            fleet.current_output,
+            float(self.damping),
+            float(self.dt),
+            float(self.nominal_freq),
+            self.frequency,
+            fleet._out,
+        )
 
-            # Swing equation for frequency update
-            total_inertia = sum(g.inertia for g in self.generators)
-            df_dt = (gen_power - demand - self.damping * freq_dev) / (2 * total_inertia * self.nominal_freq)
-            new_freq = freq + df_dt * self.dt
-            self.frequency.append(new_freq)
+        fleet._i = fleet._out.shape[1]
+        for i, g in enumerate(self._members):
+            g.current_output = fleet.current_output[i]
+            g._i = fleet._i
 
     def plot_results(self):
         time = self.load_profile.time
-        gen_outputs = np.array([g.p_output for g in self.generators])
+        gen_outputs = self.generators.p_output
 
         plt.figure(figsize=(12, 6))
 
@@ -105,7 +326,7 @@ class Grid:
 
         # Power dispatch plot
         plt.subplot(2, 1, 2)
-        plt.stackplot(time, gen_outputs, labels=[g.name for g in self.generators])
+        plt.stackplot(time, gen_outputs, labels=self.generators.names)
         plt.plot(time, self.load_profile.profile, "k--", label="Load")
         plt.xlabel("Time (hours)")
         plt.ylabel("Power (MW)")
@@ -119,15 +340,13 @@ class Grid:
 # Example Usage
 # -------------------------------
 if __name__ == "__main__":
-    np.random.seed(42)  # Reproducibility
-
     # Define generators with inertia and droop
     gen1 = Generator("Coal", p_max=50, inertia=5.0, damping=1.0, droop=0.05, response_rate=0.2)
     gen2 = Generator("Gas", p_max=30, inertia=3.0, damping=1.0, droop=0.05, response_rate=0.3)
     gen3 = Generator("Hydro", p_max=20, inertia=2.0, damping=0.5, droop=0.05, response_rate=0.4)
 
     # Define load profile with random fluctuations
-    load = LoadProfile(base_load=40, peak_load=80, hours=24, dt=0.1, noise_std=1.5)
+    load = LoadProfile(base_load=40, peak_load=80, hours=24, dt=0.1, noise_std=1.5, seed=42)  # seeded for reproducibility
 
     # Create and run grid simulation
     grid = Grid([gen1, gen2, gen3], load, nominal_freq=50, dt=0.1)
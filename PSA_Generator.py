@@ -1,3 +1,4 @@
+import os
 import pypsa
 import pandas as pd
 import numpy as np
@@ -40,7 +41,16 @@ n.add(
     p_min_pu=0.0
 )
 
-n.optimize(solver_name="highs") 
+n.optimize(
+    solver_name="highs",
+    solver_options={
+        "solver": "ipm",
+        "parallel": "on",
+        "presolve": "on",
+        "threads": os.cpu_count(),
+        "log_to_console": False,
+    },
+)
 
 fig, ax = plt.subplots(figsize=(12, 6))
 
@@ -1,8 +1,20 @@
+import os
 import pypsa
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+rng = np.random.default_rng(42)
+
+# Hourly share of the daily EV charging energy
+_EV_SHAPE = np.array([0.090,0.083,0.068,0.045,
+0.026,0.012,0.002,0.000,
+0.002,0.008,0.011,0.015,
+0.015,0.023,0.038,0.033,
+0.038,0.038,0.035,0.048,
+0.045,0.090,0.120,0.120,
+], dtype=np.float64)
+
 hours = pd.date_range("2022-01-01 00:00", "2022-01-01 23:00", freq="H")
 
 n = pypsa.Network()
@@ -10,21 +22,16 @@ n.set_snapshots(hours)
 
 n.add("Bus", "main_bus")
 EV_Total_Load = 2000
-EV_Load = np.array([0.090,0.083,0.068,0.045,
-0.026,0.012,0.002,0.000,
-0.002,0.008,0.011,0.015,
-0.015,0.023,0.038,0.033,
-0.038,0.038,0.035,0.048,
-0.045,0.090,0.120,0.120,
-]) * EV_Total_Load
+EV_Load = _EV_SHAPE * EV_Total_Load
 
 duck_curve = np.array([
     900, 880, 860, 850, 870, 920, 1000, 1100,   # morning rise
     1050, 950, 800, 700, 650, 680, 750, 900,    # midday dip
     1100, 1300, 1500, 1650, 1750, 1700, 1500, 1200  # evening ramp + peak
-])
-noise = np.random.normal(0, 50, len(duck_curve))
-duck_curve = np.clip(duck_curve + noise, 0, None)
+], dtype=np.float64)
+noise = rng.standard_normal(len(duck_curve))
+noise *= 50
+np.clip(duck_curve + noise, 0, None, out=duck_curve)
 load_final = duck_curve + EV_Load
 n.add("Load", "demand", bus="main_bus", p_set=load_final)
 
@@ -68,7 +75,16 @@ n.add(
 )
 
 # --- Solve ---
-n.optimize(solver_name="highs")
+n.optimize(
+    solver_name="highs",
+    solver_options={
+        "solver": "ipm",
+        "parallel": "on",
+        "presolve": "on",
+        "threads": os.cpu_count(),
+        "log_to_console": False,
+    },
+)
 
 # Extract results
 thermal = n.generators_t.p["Thermal_Gen"]
@@ -97,7 +113,7 @@ ax.fill_between(hours, solar + thermal, solar + thermal + slack, label="Slack Ge
 
 # Curtailment (between used solar and potential)
 ax.fill_between(hours, solar, solar_potential,
-                color="orange", alpha=0.3, hatch="///",
+                facecolor="orange", alpha=0.35, edgecolor="darkorange", linewidth=0.3,
                 label="Solar Curtailment (Wasted)")
 
 # Solar potential line
@@ -1,11 +1,11 @@
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
+import os
+from excel_cache import load_excel
 # Replace with your Excel file path
-file_path = ".\Load_Data\Daily_Demand_Profile_2.xlsx"
+file_path = os.path.join("Load_Data", "Daily_Demand_Profile_2.xlsx")
 
-# Load the Excel sheet
-df = pd.read_excel(file_path, sheet_name=0)
+# Load the Excel sheet (parsed once, then read back from a Parquet cache)
+df = load_excel(file_path, sheet_name=0)
 
 # Ensure column names are clean
 df = df.rename(columns={
@@ -14,28 +14,20 @@ df = df.rename(columns={
     "Hourly Demand Met (in MW)": "Demand_MW"
 })
 
-normalized_profiles = []
-max_values = []
+# Step 1: One row per date, one column per hour
+demand = df.pivot(index="Date", columns="Hour", values="Demand_MW").sort_index(axis=1).to_numpy(dtype=float)
 
-for date, group in df.groupby("Date"):
-    group = group.sort_values("Hour")
-    demand = group["Demand_MW"].values
+max_values = demand.max(axis=1)
+has_load = max_values > 0
 
-    max_demand = demand.max()
-    max_values.append(max_demand)
-
-    if max_demand > 0:
-        norm = demand / max_demand
-    else:
-        norm = np.zeros_like(demand)
-
-    normalized_profiles.append(norm)
+normalized_profiles = np.zeros_like(demand)
+normalized_profiles[has_load] = demand[has_load] / max_values[has_load, None]
 
 # Step 2: Average normalized profiles across dates
-avg_normalized_profile = np.mean(normalized_profiles, axis=0)
+avg_normalized_profile = normalized_profiles.mean(axis=0)
 
 # Step 3: Overall max demand value
-overall_max = max(max_values)
+overall_max = max_values.max()
 
 print("Average Normalized Load Profile (24 values):")
 print(avg_normalized_profile.tolist())
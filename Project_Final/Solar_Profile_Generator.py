@@ -3,54 +3,72 @@ import numpy as np
 import glob
 import os
 import warnings
+import pyarrow.dataset as ds
+from excel_cache import cache_excel
 warnings.filterwarnings('ignore')
 # Path where monthly XLSX files are stored
 folder = "./Solar_Data"
 
 # Collect all Excel files
 files = sorted(glob.glob(os.path.join(folder, "*.xlsx")))
-monthly_profiles = {}
 
+# Parse each workbook once into a Parquet cache
+cached = []
 for f in files:
     print(f"Reading: {f}")
     # Read Sheet-2 only
-    df = pd.read_excel(f, sheet_name=2)
-    print(df.columns)
-    df = df[["Time", "Solar+Wind"]].copy()
+    cached.append(str(cache_excel(f, sheet_name=2, columns=["Time", "Solar+Wind"])))
 
-    # Parse timestamps
-    df["Time"] = pd.to_datetime(df["Time"])
-    df = df.sort_values("Time")
+# Scan all months as one dataset, loading only the needed columns,
+# and tag every row with the workbook it came from
+dataset = ds.dataset(cached, format="parquet")
+df = pd.concat(
+    [frag.to_table(columns=["Time", "Solar+Wind"]).to_pandas().assign(Source=frag.path)
+     for frag in dataset.get_fragments()],
+    ignore_index=True,
+)
+df["Time"] = pd.to_datetime(df["Time"])
 
-    # Resample to hourly
-    hourly = df.set_index("Time").resample("H").mean().reset_index()
+# Label each workbook by the month of its first timestamp (e.g. "2023-09"),
+# so a trailing row from the next month stays with its own file
+first_time = df.groupby("Source")["Time"].transform("min")
+df["Month"] = first_time.dt.to_period("M").dt.strftime("%Y-%m")
 
-    # Extract month name (e.g., "2023-09")
-    month_label = hourly["Time"].dt.to_period("M").iloc[0].strftime("%Y-%m")
+# Resample each workbook to hourly in one grouped pass
+hourly = (
+    df.set_index("Time")
+    .groupby("Month")["Solar+Wind"]
+    .resample("h")
+    .mean()
+    .reset_index()
+)
 
-    # Compute average profile (group by hour of day)
-    avg_profile = hourly.groupby(hourly["Time"].dt.hour)["Solar+Wind"].mean().values
+# Average profile per month (rows) and hour of day (columns)
+monthly_hourly = (
+    hourly.groupby(["Month", hourly["Time"].dt.hour])["Solar+Wind"]
+    .mean()
+    .unstack()
+)
 
-    # Save raw MW and normalized profile
-    P_solar = avg_profile
-    if P_solar.max() > 0:
-        solar_profile = P_solar / P_solar.max()
-    else:
-        solar_profile = np.zeros_like(P_solar)
+# Raw MW and normalized profile for every month at once
+P_solar = monthly_hourly.to_numpy()
+P_max = P_solar.max(axis=1)
+solar_profiles = np.zeros_like(P_solar)
+solar_profiles[P_max > 0] = P_solar[P_max > 0] / P_max[P_max > 0, None]
 
-    monthly_profiles[month_label] = {
-        "P_solar": P_solar,
-        "solar_profile": solar_profile
+monthly_profiles = {
+    month: {
+        "P_solar": P_solar[i],
+        "solar_profile": solar_profiles[i]
     }
+    for i, month in enumerate(monthly_hourly.index)
+}
 
 # Save outputs
 np.save("monthly_profiles.npy", monthly_profiles)
 
-avg_P_max = 0
-avg_Solar_profile = np.zeros(24)
-for m, prof in monthly_profiles.items():
-    avg_P_max += prof['P_solar'].max()/12
-    avg_Solar_profile += prof['solar_profile']/12
+avg_P_max = P_max.mean()
+avg_Solar_profile = solar_profiles.mean(axis=0)
 
 print(f"P_Max: {avg_P_max} MW")
 print(f"Profile: {avg_Solar_profile}")
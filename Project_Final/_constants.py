@@ -0,0 +1,23 @@
+import pandas as pd
+import numpy as np
+
+# Shared snapshot set, so every network solves over identical hours
+HOURS = pd.date_range("2022-01-01", periods=24, freq="h")
+
+# Average normalized national load profile (Load_Profile_Generator.py)
+NORMALIZED_LOAD = np.array([0.7577501967973916, 0.739805740179444, 0.7236425422806064, 0.7167554231733221, 0.7289250057644614, 0.7714951706178165, 0.8265810310571715, 0.8790824660440677, 0.9155464243592003, 0.9470454925165577, 0.9619121517351206, 0.964467442854757, 0.9567006049840137, 0.935814561556312, 0.9171227622542776, 0.9053691214039998, 0.8965894983220128, 0.9131303418800689, 0.981645190522445, 0.9767607899375252, 0.9203511944365227, 0.8805342280768892, 0.8512557333958513, 0.8259928401372565], dtype=np.float64)
+
+# Average normalized solar availability (Solar_Profile_Generator.py)
+SOLAR_PROFILE = np.array([0.21673631, 0.21191633, 0.20672958, 0.20005439, 0.19256323, 0.18435334,
+ 0.19490409, 0.30168449, 0.52745781, 0.75161649, 0.90866067, 0.98641145,
+ 0.9997654,  0.97321698, 0.89745004, 0.75760522, 0.56115675, 0.34809376,
+ 0.23500542, 0.21850131, 0.21957297, 0.22213894, 0.22196219, 0.2206215], dtype=np.float64)
+
+# Hourly share of the daily EV charging energy
+EV_SHAPE = np.array([0.090,0.083,0.068,0.045,
+0.026,0.012,0.002,0.000,
+0.002,0.008,0.011,0.015,
+0.015,0.023,0.038,0.033,
+0.038,0.038,0.035,0.048,
+0.045,0.090,0.120,0.120,
+], dtype=np.float64)
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import pypsa
+from _constants import HOURS, SOLAR_PROFILE
+
+P_Solar_Max = 200105.71993774092
+
+# HiGHS settings for one-off solves of the 24-snapshot LP
+SOLVER_OPTIONS = {
+    "solver": "ipm",
+    "parallel": "on",
+    "presolve": "on",
+    "threads": os.cpu_count(),
+    "log_to_console": False,
+}
+
+
+def make_network(load_final):
+    """
+    Single-bus network with the national generation fleet meeting load_final
+    """
+    n = pypsa.Network()
+    n.set_snapshots(HOURS)
+
+    n.add("Bus", "main_bus")
+    n.add("Load", "demand", bus="main_bus", p_set=load_final)
+
+    # --- Generators ---
+
+    # Thermal generator (baseline)
+    n.add(
+        "Generator",
+        "Thermal_Gen",
+        bus="main_bus",
+        p_nom=200000,
+        marginal_cost=50,
+        p_min_pu=0.2,
+        efficiency=0.4
+    )
+
+    n.add(
+        "Generator",
+        "Hydropower",
+        bus="main_bus",
+        p_nom=50000,
+        marginal_cost=40,
+        p_min_pu=0.4
+    )
+
+    # Slack generator (expensive backup)
+    n.add(
+        "Generator",
+        "Slack_Gen",
+        bus="main_bus",
+        p_nom=100000,
+        marginal_cost=1000,
+        p_min_pu=0.0
+    )
+
+    # Solar generator (large enough to exceed load at midday)
+    n.add(
+        "Generator",
+        "Solar",
+        bus="main_bus",
+        p_nom=P_Solar_Max,
+        p_max_pu=SOLAR_PROFILE,  # availability
+        marginal_cost=0.0
+    )
+
+    return n
+
+
+def solve_network(n, **kwargs):
+    """
+    Build the optimisation model for n and solve it
+    """
+    kwargs.setdefault("solver_options", SOLVER_OPTIONS)
+    n.optimize.create_model()
+    return n.optimize.solve_model(solver_name="highs", **kwargs)
+
+
+def solve_scenarios(n, loads, **kwargs):
+    """
+    Solve n once per demand profile in loads, building the model only once.
+    Each scenario swaps the nodal balance right-hand side (the load) in place
+    and warm-starts HiGHS from the previous scenario's basis.
+    Returns the generator dispatch of every scenario.
+    """
+    # Basis reuse only pays off for simplex, the interior point method ignores it
+    kwargs.setdefault("solver_options", dict(SOLVER_OPTIONS, solver="simplex"))
+
+    model = n.optimize.create_model()
+    balance = model.constraints["Bus-nodal_balance"]
+    # Bus dimension is "Bus" before PyPSA 1.0 and "name" after
+    bus_dim = next(d for d in balance.rhs.dims if d != "snapshot")
+
+    dispatch = []
+    with tempfile.TemporaryDirectory() as tmp:
+        basis = os.path.join(tmp, "highs.bas")
+        for load in loads:
+            n.loads_t.p_set["demand"] = load
+            rhs = balance.rhs.copy()
+            rhs.loc[{bus_dim: "main_bus"}] = load
+            balance.update(rhs=rhs)
+
+            warmstart = basis if os.path.exists(basis) else None
+            n.optimize.solve_model(solver_name="highs", basis_fn=basis, warmstart_fn=warmstart, **kwargs)
+            dispatch.append(n.generators_t.p.copy())
+    return dispatch
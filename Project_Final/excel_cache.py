@@ -0,0 +1,36 @@
+import hashlib
+from pathlib import Path
+
+import pandas as pd
+
+
+def cache_path(path, sheet_name=0, columns=None):
+    """
+    Parquet cache file for one sheet (and column subset) of a workbook,
+    e.g. Data.xlsx -> Data.sheet2.<column hash>.parquet
+    """
+    path = Path(path)
+    name = f"{path.stem}.sheet{sheet_name}"
+    if columns is not None:
+        name += "." + hashlib.sha1("\0".join(map(str, columns)).encode()).hexdigest()[:8]
+    return path.with_name(name + ".parquet")
+
+
+def cache_excel(path, sheet_name=0, columns=None):
+    """
+    Convert one Excel sheet to a Parquet file next to it and return the
+    Parquet path. Each sheet and column subset gets its own cache file, and
+    the conversion is redone only when the workbook is newer than its cache.
+    """
+    path = Path(path)
+    pq = cache_path(path, sheet_name, columns)
+    if not pq.exists() or pq.stat().st_mtime < path.stat().st_mtime:
+        pd.read_excel(path, sheet_name=sheet_name, usecols=columns).to_parquet(pq)
+    return pq
+
+
+def load_excel(path, sheet_name=0, columns=None):
+    """
+    Read an Excel sheet through its Parquet cache
+    """
+    return pd.read_parquet(cache_excel(path, sheet_name, columns), columns=columns)
@@ -0,0 +1,77 @@
+import sys
+import numpy as np
+import pandas as pd
+import matplotlib
+
+# Skip GUI backend initialisation when only the figure file is wanted
+HEADLESS = "--headless" in sys.argv
+if HEADLESS:
+    matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# Generation stack, bottom to top: (results key, label, colour)
+STACK = [
+    ("solar", "Solar Used", "gold"),
+    ("thermal", "Thermal Gen", "tab:blue"),
+    ("hydro", "Hydro Gen", "tab:green"),
+    ("ev_discharge", "EV V2G", "tab:purple"),
+    ("slack", "Slack Gen", "tab:red"),
+]
+
+
+def plot_results(results_path, figure_path=None):
+    """
+    Load vs generation plot for a results .npz saved by one of the grid scripts
+    """
+    r = np.load(results_path)
+    hours = pd.DatetimeIndex(r["hours"])
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    # Demand
+    if "domestic" in r:
+        ax.plot(hours, r["domestic"], label="Domestic Load (MW)", color="blue", alpha=0.1, linewidth=2, zorder=3)
+        ax.plot(hours, r["ev"], label="EV Load (MW)", color="green", alpha=1, linewidth=2, zorder=3)
+        ax.plot(hours, r["total"], label="Total Load (MW)", color="black", linewidth=2, zorder=3)
+    else:
+        ax.plot(hours, r["total"], label="Load (MW)", color="black", linewidth=2, zorder=3)
+
+    # Stack: Solar used, Thermal, Hydro, (EV V2G), Slack
+    bottom = np.zeros(len(hours))
+    for key, label, color in STACK:
+        if key not in r:
+            continue
+        top = bottom + r[key]
+        ax.fill_between(hours, bottom, top, label=label, alpha=0.6, color=color)
+        bottom = top
+
+    # Curtailment (between used solar and potential)
+    ax.fill_between(hours, r["solar"], r["solar_potential"],
+                    facecolor="orange", alpha=0.35, edgecolor="darkorange", linewidth=0.3,
+                    label="Solar Curtailment (Wasted)")
+
+    # Solar potential line
+    ax.plot(hours, r["solar_potential"], linestyle="--", color="orange", alpha=0.7,
+            label="Solar Potential")
+
+    # Formatting
+    ax.set_title("Load vs Generation", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Hour of Day", fontsize=12)
+    ax.set_ylabel("Power (MW)", fontsize=12)
+    ax.set_xticks(hours[::2])
+    ax.set_xticklabels([h.strftime("%H:%M") for h in hours[::2]], rotation=45)
+
+    ax.legend(loc="upper left", frameon=True)
+    ax.grid(True, linestyle="--", alpha=0.5)
+
+    plt.tight_layout()
+    if figure_path is not None:
+        plt.savefig(figure_path)
+    if not HEADLESS:
+        plt.show()
+
+
+if __name__ == "__main__":
+    # Usage: python plot.py results.npz [figure.png] [--headless]
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    plot_results(args[0], args[1] if len(args) > 1 else None)
@@ -0,0 +1,77 @@
+import importlib
+import itertools
+import os
+import sys
+import numpy as np
+from joblib import Parallel, delayed
+from _constants import NORMALIZED_LOAD, SOLAR_PROFILE, EV_SHAPE
+from common import P_Solar_Max, SOLVER_OPTIONS, make_network, solve_scenarios
+
+# Peak domestic load (MW) of each scenario
+MAX_LOADS = [140000, 161386.94, 180000]
+
+# EV size of each scenario, per script:
+# daily EV charging energy (MWh) for Normal_Grid_With_EV, fleet power (MW) for V2G
+EV_CAPACITIES = {
+    "Normal_Grid_With_EV": [0, 28000, 56000, 84000],
+    "V2G": [17500, 35000, 70000, 105000],
+}
+
+# One HiGHS thread per scenario, the scenarios themselves fill the cores
+SWEEP_SOLVER_OPTIONS = dict(SOLVER_OPTIONS, parallel="off", threads=1)
+
+
+def sweep_loads(grid):
+    """
+    Normal_Grid_With_EV scenarios only change the load, so a single network
+    and model is built and re-solved for every scenario
+    """
+    max_loads, ev_capacities = np.array(grid, dtype=np.float64).T
+
+    # Scenario loads as one (n_scenarios, 24) matrix, domestic plus EV charging
+    loads = np.empty((len(grid), len(NORMALIZED_LOAD)))
+    np.multiply.outer(max_loads, NORMALIZED_LOAD, out=loads)
+    loads += np.multiply.outer(ev_capacities, EV_SHAPE)
+
+    dispatch = solve_scenarios(make_network(loads[0]), loads)
+
+    solar_potential = P_Solar_Max * SOLAR_PROFILE
+    return [np.maximum(solar_potential - p["Solar"].to_numpy(), 0).sum() for p in dispatch]
+
+
+def run_scenario(script, max_load, ev_capacity):
+    """
+    Solve one scenario with the solve() of the given grid script
+    """
+    module = importlib.import_module(script)
+    results = module.solve(NORMALIZED_LOAD * max_load, ev_capacity, solver_options=SWEEP_SOLVER_OPTIONS)
+    return results["curtailment"]
+
+
+if __name__ == "__main__":
+    # Usage: python sweep.py [Normal_Grid_With_EV|V2G]
+    script = sys.argv[1] if len(sys.argv) > 1 else "Normal_Grid_With_EV"
+    if script not in EV_CAPACITIES:
+        sys.exit(f"Usage: python sweep.py [{'|'.join(EV_CAPACITIES)}]")
+    grid = list(itertools.product(MAX_LOADS, EV_CAPACITIES[script]))
+
+    if script == "Normal_Grid_With_EV":
+        curtailment = sweep_loads(grid)
+    else:
+        # The EV fleet changes the network itself, so every scenario is built
+        # and solved separately; loky spawns fresh worker processes because
+        # PyPSA/linopy solves are not fork-safe
+        curtailment = Parallel(n_jobs=-1, backend="loky")(
+            delayed(run_scenario)(script, max_load, ev_capacity) for max_load, ev_capacity in grid
+        )
+
+    for (max_load, ev_capacity), curtail in zip(grid, curtailment):
+        print(f"Max load {max_load:>10} MW, EV {ev_capacity:>7}: curtailed {curtail:.1f} MWh")
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    np.savez(
+        os.path.join(here, f"sweep_{script}.npz"),
+        max_load=np.array([g[0] for g in grid]),
+        ev_capacity=np.array([g[1] for g in grid]),
+        curtailment=np.array(curtailment),
+    )
@@ -1,3 +1,4 @@
+import os
 import pypsa
 import pandas as pd
 import numpy as np
@@ -61,7 +62,16 @@ n.add(
 )
 
 # --- Solve the optimization problem ---
-n.optimize(solver_name="highs")
+n.optimize(
+    solver_name="highs",
+    solver_options={
+        "solver": "ipm",
+        "parallel": "on",
+        "presolve": "on",
+        "threads": os.cpu_count(),
+        "log_to_console": False,
+    },
+)
 
 # Extract the generation results from the solved network
 thermal = n.generators_t.p["Thermal_Gen"]
@@ -93,9 +103,10 @@ ax.fill_between(
     duck_curve,
     solar_potential,
     where=solar_potential > duck_curve,
-    color="orange",
-    alpha=0.3,
-    hatch="///",
+    facecolor="orange",
+    alpha=0.35,
+    edgecolor="darkorange",
+    linewidth=0.3,
     label="Solar Curtailment (Wasted)"
 )
 